@@ -868,7 +868,6 @@ class BetfairExecutionClient(LiveExecutionClient):
         if client_order_id is None:
             self._log.warning(f"Can't find client_order_id for {unmatched_order}")
             return
-        PyCondition.type(client_order_id, ClientOrderId, "client_order_id")
         order = self._cache.order(client_order_id)
         PyCondition.not_none(order, "order")
         instrument = self._cache.instrument(order.instrument_id)
@@ -880,12 +879,13 @@ class BetfairExecutionClient(LiveExecutionClient):
         """
         venue_order_id = VenueOrderId(str(unmatched_order.id))
 
-        # Check if this is the first time seeing this order (backtest or replay)
-        if venue_order_id in self.venue_order_id_to_client_order_id:
-            # We've already sent an accept for this order in self._submit_order
-            self._log.info(f"Skipping order_accept as order exists: {venue_order_id=}")
+        client_order_id = self.venue_order_id_to_client_order_id.get(venue_order_id)
+        if client_order_id is None:
+            return  # Already warned by _check_order_update
+
+        # We've already sent an accept for this order in self._submit_order
+        self._log.info(f"Skipping order_accept as order exists: {venue_order_id=}")
 
-        client_order_id = self.venue_order_id_to_client_order_id[venue_order_id]
         order = self._cache.order(client_order_id)
         instrument = self._cache.instrument(order.instrument_id)
 
@@ -1012,12 +1012,10 @@ class BetfairExecutionClient(LiveExecutionClient):
                     venue_order_id=venue_order_id,
                     ts_event=cancelled_ts,
                 )
-                if venue_order_id in self.venue_order_id_to_client_order_id:
-                    del self.venue_order_id_to_client_order_id[venue_order_id]
+                self.venue_order_id_to_client_order_id.pop(venue_order_id, None)
         # Market order will not be in self.published_executions
-        if client_order_id in self.published_executions:
-            # This execution is complete - no need to track this anymore
-            del self.published_executions[client_order_id]
+        # This execution is complete - no need to track this anymore
+        self.published_executions.pop(client_order_id, None)
 
     async def wait_for_order(
         self,
@@ -1039,8 +1037,8 @@ class BetfairExecutionClient(LiveExecutionClient):
             # self._log.debug(
             #     f"checking venue_order_id={venue_order_id} in {self.venue_order_id_to_client_order_id}"
             # )
-            if venue_order_id in self.venue_order_id_to_client_order_id:
-                client_order_id = self.venue_order_id_to_client_order_id[venue_order_id]
+            client_order_id = self.venue_order_id_to_client_order_id.get(venue_order_id)
+            if client_order_id is not None:
                 self._log.debug(
                     f"Found order in {nanos_to_micros(now - start)}us: {client_order_id}",
                 )
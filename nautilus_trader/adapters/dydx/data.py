@@ -133,6 +133,20 @@ class DYDXDataClient(LiveMarketDataClient):
         self._decoder_ws_kline_subscribed = msgspec.json.Decoder(DYDXWsCandlesSubscribedData)
         self._decoder_ws_instruments = msgspec.json.Decoder(DYDXWsMarketChannelData)
         self._decoder_ws_instruments_subscribed = msgspec.json.Decoder(DYDXWsMarketSubscribedData)
+
+        # WebSocket message handlers keyed by (channel, type)
+        self._ws_handlers: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
+            ("v4_orderbook", "channel_data"): self._handle_orderbook,
+            ("v4_orderbook", "subscribed"): self._handle_orderbook_snapshot,
+            ("v4_orderbook", "channel_batch_data"): self._handle_orderbook_batched,
+            ("v4_trades", "channel_data"): self._handle_trade,
+            ("v4_trades", "subscribed"): self._handle_trade_subscribed,
+            ("v4_candles", "channel_data"): self._handle_kline,
+            ("v4_candles", "subscribed"): self._handle_kline_subscribed,
+            ("v4_markets", "channel_data"): self._handle_markets,
+            ("v4_markets", "subscribed"): self._handle_markets_subscribed,
+        }
+
         self._ws_client = DYDXWebsocketClient(
             clock=clock,
             handler=self._handle_ws_message,
@@ -158,6 +172,7 @@ class DYDXDataClient(LiveMarketDataClient):
 
         # Hot caches
         self._bars: dict[BarType, Bar] = {}
+        self._instrument_ids: dict[str, InstrumentId] = {}
 
     async def _connect(self) -> None:
         await self._instrument_provider.initialize()
@@ -234,23 +249,12 @@ class DYDXDataClient(LiveMarketDataClient):
             self._cache.add_currency(currency)
 
     def _handle_ws_message(self, raw: bytes) -> None:
-        callbacks: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
-            ("v4_orderbook", "channel_data"): self._handle_orderbook,
-            ("v4_orderbook", "subscribed"): self._handle_orderbook_snapshot,
-            ("v4_orderbook", "channel_batch_data"): self._handle_orderbook_batched,
-            ("v4_trades", "channel_data"): self._handle_trade,
-            ("v4_trades", "subscribed"): self._handle_trade_subscribed,
-            ("v4_candles", "channel_data"): self._handle_kline,
-            ("v4_candles", "subscribed"): self._handle_kline_subscribed,
-            ("v4_markets", "channel_data"): self._handle_markets,
-            ("v4_markets", "subscribed"): self._handle_markets_subscribed,
-        }
         try:
             ws_message = self._decoder_ws_msg_general.decode(raw)
-            key = (ws_message.channel, ws_message.type)
+            handler = self._ws_handlers.get((ws_message.channel, ws_message.type))
 
-            if key in callbacks:
-                callbacks[key](raw)
+            if handler is not None:
+                handler(raw)
                 return
 
             if ws_message.type == "unsubscribed":
@@ -283,12 +287,14 @@ class DYDXDataClient(LiveMarketDataClient):
                 self._log.error(f"Cannot parse trade data: no instrument for {instrument_id}")
                 return
 
+            ts_init = self._clock.timestamp_ns()
+
             for tick_msg in msg.contents.trades:
                 trade_tick = tick_msg.parse_to_trade_tick(
                     instrument_id,
                     price_precision=instrument.price_precision,
                     size_precision=instrument.size_precision,
-                    ts_init=self._clock.timestamp_ns(),
+                    ts_init=ts_init,
                 )
                 self._handle_data(trade_tick)
 
@@ -796,9 +802,11 @@ class DYDXDataClient(LiveMarketDataClient):
         await self._ws_client.unsubscribe_klines(dydx_symbol.raw_symbol, candles_resolution)
 
     def _get_cached_instrument_id(self, symbol: str) -> InstrumentId:
-        dydx_symbol = DYDXSymbol(symbol)
-        nautilus_instrument_id: InstrumentId = dydx_symbol.to_instrument_id()
-        return nautilus_instrument_id
+        instrument_id: InstrumentId | None = self._instrument_ids.get(symbol)
+        if instrument_id is None:
+            instrument_id = DYDXSymbol(symbol).to_instrument_id()
+            self._instrument_ids[symbol] = instrument_id
+        return instrument_id
 
     async def _request_bars(
         self,
@@ -97,6 +97,8 @@ from nautilus_trader.model.orders import Order
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from nautilus_trader.model.objects import Currency
 
 
@@ -110,6 +112,7 @@ class ClientOrderIdHelper:
         Generate integer client order IDs.
         """
         self._cache = cache
+        self._client_order_ids: dict[int, ClientOrderId] = {}
 
     def generate_client_order_id_int(self, client_order_id: ClientOrderId) -> int:
         """
@@ -127,6 +130,7 @@ class ClientOrderIdHelper:
             client_order_id_int.to_bytes(length=4, byteorder="big"),
         )
         self._cache.add(str(client_order_id_int), client_order_id.value.encode("utf-8"))
+        self._client_order_ids[client_order_id_int] = client_order_id
 
         return client_order_id_int
 
@@ -150,10 +154,17 @@ class ClientOrderIdHelper:
         """
         Retrieve the ClientOrderId from the cache.
         """
+        client_order_id = self._client_order_ids.get(client_order_id_int)
+
+        if client_order_id is not None:
+            return client_order_id
+
         value = self._cache.get(str(client_order_id_int))
 
         if value is not None:
-            return ClientOrderId(value.decode("utf-8"))
+            client_order_id = ClientOrderId(value.decode("utf-8"))
+            self._client_order_ids[client_order_id_int] = client_order_id
+            return client_order_id
 
         return ClientOrderId(str(client_order_id_int))
 
@@ -264,10 +275,19 @@ class DYDXExecutionClient(LiveExecutionClient):
         )
         self._decoder_ws_block_height_channel = msgspec.json.Decoder(DYDXWsBlockHeightChannelData)
 
+        # WebSocket message handlers keyed by (channel, type)
+        self._ws_handlers: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
+            ("v4_block_height", "channel_data"): self._handle_block_height_channel_data,
+            ("v4_subaccounts", "channel_data"): self._handle_subaccounts_channel_data,
+            ("v4_block_height", "subscribed"): self._handle_block_height_subscribed,
+            ("v4_subaccounts", "subscribed"): self._handle_subaccounts_subscribed,
+        }
+
         # Hot caches
         self._order_builders: dict[InstrumentId, OrderBuilder] = {}
         self._generate_order_status_retries: dict[ClientOrderId, int] = {}
         self._block_height: int = 0
+        self._instrument_ids: dict[str, InstrumentId] = {}
 
         self._retry_manager_pool = RetryManagerPool(
             pool_size=100,
@@ -705,15 +725,10 @@ class DYDXExecutionClient(LiveExecutionClient):
     def _handle_ws_message(self, raw: bytes) -> None:
         try:
             ws_message = self._decoder_ws_msg_general.decode(raw)
+            handler = self._ws_handlers.get((ws_message.channel, ws_message.type))
 
-            if ws_message.channel == "v4_block_height" and ws_message.type == "channel_data":
-                self._handle_block_height_channel_data(raw)
-            elif ws_message.channel == "v4_subaccounts" and ws_message.type == "channel_data":
-                self._handle_subaccounts_channel_data(raw)
-            elif ws_message.channel == "v4_block_height" and ws_message.type == "subscribed":
-                self._handle_block_height_subscribed(raw)
-            elif ws_message.channel == "v4_subaccounts" and ws_message.type == "subscribed":
-                self._handle_subaccounts_subscribed(raw)
+            if handler is not None:
+                handler(raw)
             elif ws_message.type == "unsubscribed":
                 self._log.info(
                     f"Unsubscribed from channel {ws_message.channel} for {ws_message.id}",
@@ -765,7 +780,7 @@ class DYDXExecutionClient(LiveExecutionClient):
             instruments = self._instrument_provider.get_all()
 
             for perpetual_position in msg.contents.subaccount.openPerpetualPositions.values():
-                instrument_id = DYDXSymbol(perpetual_position.market).to_instrument_id()
+                instrument_id = self._get_cached_instrument_id(perpetual_position.market)
                 instrument = self._cache.instrument(instrument_id)
 
                 if instrument is None:
@@ -820,8 +835,10 @@ class DYDXExecutionClient(LiveExecutionClient):
                     self._handle_fill_message(fill_msg=fill_msg)
 
             if msg.contents.orders is not None:
+                ts_init = self._clock.timestamp_ns()
+
                 for order_msg in msg.contents.orders:
-                    self._handle_order_message(order_msg=order_msg)
+                    self._handle_order_message(order_msg=order_msg, ts_init=ts_init)
 
         except Exception as e:
             self._log.error(
@@ -831,6 +848,7 @@ class DYDXExecutionClient(LiveExecutionClient):
     def _handle_order_message(
         self,
         order_msg: DYDXWsOrderSubaccountMessageContents,
+        ts_init: int,
     ) -> None:
         client_order_id = None
 
@@ -839,7 +857,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                 client_order_id_int=int(order_msg.clientId),
             )
 
-        instrument_id = DYDXSymbol(order_msg.ticker).to_instrument_id()
+        instrument_id = self._get_cached_instrument_id(order_msg.ticker)
         instrument = self._cache.instrument(instrument_id)
 
         if instrument is None:
@@ -853,7 +871,7 @@ class DYDXExecutionClient(LiveExecutionClient):
             size_precision=instrument.size_precision,
             report_id=UUID4(),
             enum_parser=self._enum_parser,
-            ts_init=self._clock.timestamp_ns(),
+            ts_init=ts_init,
         )
 
         strategy_id = None
@@ -902,7 +920,7 @@ class DYDXExecutionClient(LiveExecutionClient):
             self._log.error(message)
 
     def _handle_fill_message(self, fill_msg: DYDXWsFillSubaccountMessageContents) -> None:
-        instrument_id = DYDXSymbol(fill_msg.ticker).to_instrument_id()
+        instrument_id = self._get_cached_instrument_id(fill_msg.ticker)
         instrument = self._cache.instrument(instrument_id)
 
         if instrument is None:
@@ -946,14 +964,21 @@ class DYDXExecutionClient(LiveExecutionClient):
             trade_id=TradeId(fill_msg.id),
             order_side=self._enum_parser.parse_dydx_order_side(fill_msg.side),
             order_type=order.order_type,
-            last_qty=Quantity(Decimal(fill_msg.size), instrument.size_precision),
-            last_px=Price(Decimal(fill_msg.price), instrument.price_precision),
+            last_qty=Quantity(float(fill_msg.size), instrument.size_precision),
+            last_px=Price(float(fill_msg.price), instrument.price_precision),
             quote_currency=instrument.quote_currency,
             commission=commission,
             liquidity_side=self._enum_parser.parse_dydx_liquidity_side(fill_msg.liquidity),
             ts_event=dt_to_unix_nanos(fill_msg.createdAt),
         )
 
+    def _get_cached_instrument_id(self, symbol: str) -> InstrumentId:
+        instrument_id: InstrumentId | None = self._instrument_ids.get(symbol)
+        if instrument_id is None:
+            instrument_id = DYDXSymbol(symbol).to_instrument_id()
+            self._instrument_ids[symbol] = instrument_id
+        return instrument_id
+
     def _get_order_builder(self, instrument: Instrument) -> OrderBuilder:
         """
         Construct an OrderBuilder for a specific instrument.
@@ -189,8 +189,8 @@ class DYDXTrade(msgspec.Struct, forbid_unknown_fields=True):
         }
         return TradeTick(
             instrument_id=instrument_id,
-            price=Price(Decimal(self.price), price_precision),
-            size=Quantity(Decimal(self.size), size_precision),
+            price=Price(float(self.price), price_precision),
+            size=Quantity(float(self.size), size_precision),
             aggressor_side=aggressor_side_map[self.side],
             trade_id=TradeId(self.id),
             ts_event=dt_to_unix_nanos(self.createdAt),
@@ -274,14 +274,14 @@ class DYDXWsOrderbookChannelData(msgspec.Struct, forbid_unknown_fields=True):
                 # Last message in the packet from the venue for a given `instrument_id`
                 flags = RecordFlag.F_LAST
 
-            size = Quantity(Decimal(bid[1]), size_precision)
+            size = Quantity(float(bid[1]), size_precision)
             action = BookAction.DELETE if size == 0 else BookAction.UPDATE
             delta = OrderBookDelta(
                 instrument_id=instrument_id,
                 action=action,
                 order=BookOrder(
                     side=OrderSide.BUY,
-                    price=Price(Decimal(bid[0]), price_precision),
+                    price=Price(float(bid[0]), price_precision),
                     size=size,
                     order_id=0,
                 ),
@@ -300,14 +300,14 @@ class DYDXWsOrderbookChannelData(msgspec.Struct, forbid_unknown_fields=True):
                 # Last message in the book event or packet from the venue for a given `instrument_id`
                 flags = RecordFlag.F_LAST
 
-            size = Quantity(Decimal(ask[1]), size_precision)
+            size = Quantity(float(ask[1]), size_precision)
             action = BookAction.DELETE if size == 0 else BookAction.UPDATE
             delta = OrderBookDelta(
                 instrument_id=instrument_id,
                 action=action,
                 order=BookOrder(
                     side=OrderSide.SELL,
-                    price=Price(Decimal(ask[0]), price_precision),
+                    price=Price(float(ask[0]), price_precision),
                     size=size,
                     order_id=0,
                 ),
@@ -393,8 +393,8 @@ class DYDXWsOrderbookSnapshotChannelData(msgspec.Struct, forbid_unknown_fields=T
 
             order = BookOrder(
                 side=OrderSide.BUY,
-                price=Price(Decimal(bid.price), price_precision),
-                size=Quantity(Decimal(bid.size), size_precision),
+                price=Price(float(bid.price), price_precision),
+                size=Quantity(float(bid.size), size_precision),
                 order_id=0,
             )
 
@@ -423,8 +423,8 @@ class DYDXWsOrderbookSnapshotChannelData(msgspec.Struct, forbid_unknown_fields=T
                 action=BookAction.ADD,
                 order=BookOrder(
                     side=OrderSide.SELL,
-                    price=Price(Decimal(ask.price), price_precision),
-                    size=Quantity(Decimal(ask.size), size_precision),
+                    price=Price(float(ask.price), price_precision),
+                    size=Quantity(float(ask.size), size_precision),
                     order_id=0,
                 ),
                 flags=flags,
@@ -487,14 +487,14 @@ class DYDXWsOrderbookBatchedData(msgspec.Struct, forbid_unknown_fields=True):
                     # Last message in the packet from the venue for a given `instrument_id`
                     flags = RecordFlag.F_LAST
 
-                size = Quantity(Decimal(bid[1]), size_precision)
+                size = Quantity(float(bid[1]), size_precision)
                 action = BookAction.DELETE if size == 0 else BookAction.UPDATE
                 delta = OrderBookDelta(
                     instrument_id=instrument_id,
                     action=action,
                     order=BookOrder(
                         side=OrderSide.BUY,
-                        price=Price(Decimal(bid[0]), price_precision),
+                        price=Price(float(bid[0]), price_precision),
                         size=size,
                         order_id=0,
                     ),
@@ -513,14 +513,14 @@ class DYDXWsOrderbookBatchedData(msgspec.Struct, forbid_unknown_fields=True):
                     # Last message in the packet from the venue for a given `instrument_id`
                     flags = RecordFlag.F_LAST
 
-                size = Quantity(Decimal(ask[1]), size_precision)
+                size = Quantity(float(ask[1]), size_precision)
                 action = BookAction.DELETE if size == 0 else BookAction.UPDATE
                 delta = OrderBookDelta(
                     instrument_id=instrument_id,
                     action=action,
                     order=BookOrder(
                         side=OrderSide.SELL,
-                        price=Price(Decimal(ask[0]), price_precision),
+                        price=Price(float(ask[0]), price_precision),
                         size=size,
                         order_id=0,
                     ),
@@ -682,7 +682,7 @@ class DYDXWsOrderSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields
         Create an order status report from the order message.
         """
         filled_qty = (
-            Quantity(Decimal(self.totalFilled), size_precision)
+            Quantity(float(self.totalFilled), size_precision)
             if self.totalFilled is not None
             else Quantity(0, size_precision)
         )
@@ -690,13 +690,13 @@ class DYDXWsOrderSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields
 
         # Quantity cannot be set to zero or None. This most probably occurs when an order is canceled.
         quantity = (
-            Quantity(Decimal(self.size), size_precision)
+            Quantity(float(self.size), size_precision)
             if self.size is not None
             else Quantity(1, size_precision)
         )
 
         price = (
-            Price(Decimal(self.price), price_precision)
+            Price(float(self.price), price_precision)
             if self.price is not None
             else Price(0, price_precision)
         )
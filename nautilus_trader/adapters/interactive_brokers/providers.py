@@ -283,7 +283,7 @@ class InteractiveBrokersInstrumentProvider(InstrumentProvider):
 
         self._log.info(f"Attempting to find instrument for {contract=}")
         contract_details = []
-        if databento_venue in VENUE_MEMBERS.keys():
+        if databento_venue in VENUE_MEMBERS:
             # Use a safe mapping to prevent unintended symbol matches from global venues
             for exchange in VENUE_MEMBERS.get(databento_venue, []):
                 contract = instrument_id_to_ib_contract(
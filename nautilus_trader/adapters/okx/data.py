@@ -631,7 +631,7 @@ class OKXDataClient(LiveMarketDataClient):
         try:
             push_data: OKXWsOrderbookPushDataMsg = self._decoder_ws_orderbook.decode(raw)
             for book_data in push_data.data:
-                if len(book_data.asks) == 0:
+                if not book_data.asks:
                     # OKX sends empty asks/bids to inform user connection is still active (ignore)
                     continue
                 if push_data.action == "snapshot":
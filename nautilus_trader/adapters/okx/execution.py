@@ -95,6 +95,14 @@ from nautilus_trader.model.orders import TrailingStopMarketOrder
 from nautilus_trader.model.position import Position
 
 
+EXEC_CLIENT_SUPPORTED_PUSH_DATA_CHANNELS = (
+    "account",
+    "fills",
+    "orders",
+    "positions",
+)
+
+
 class OKXExecutionClient(LiveExecutionClient):
     """
     Provides an execution client for the OKX centralized crypto exchange.
@@ -1008,9 +1016,9 @@ class OKXExecutionClient(LiveExecutionClient):
     async def _submit_order_list(self, command: SubmitOrderList) -> None:
         self._log.debug(f"Submit list of {len(command.order_list.orders)} orders", LogColor.CYAN)
 
+        okx_symbol = OKXSymbol(command.instrument_id.symbol.value)
+
         for order in command.order_list.orders:
-            order = command.order
-            okx_symbol = OKXSymbol(command.instrument_id.symbol.value)
             if not self._check_order_validity(order, okx_symbol.instrument_type):  # logs reason
                 continue
 
@@ -1214,12 +1222,6 @@ class OKXExecutionClient(LiveExecutionClient):
 
                 channel = push_data.arg.channel
 
-                EXEC_CLIENT_SUPPORTED_PUSH_DATA_CHANNELS = [
-                    "account",
-                    "fills",
-                    "orders",
-                    "positions",
-                ]
                 if channel not in EXEC_CLIENT_SUPPORTED_PUSH_DATA_CHANNELS:
                     self._log.error(
                         f"Received message from channel {channel}. Is this intended for the "
@@ -1315,9 +1317,9 @@ class OKXExecutionClient(LiveExecutionClient):
             )
             return
 
-        for fill in fills_push_data.data:
-            self._log.info(f"Got fill data: {raw.decode()}", LogColor.MAGENTA)
+        self._log.info(f"Got fill data: {raw.decode()}", LogColor.MAGENTA)
 
+        for fill in fills_push_data.data:
             # Find instrument
             instrument = self._instrument_provider.find_conditional(fill.instId)
             if instrument is None:
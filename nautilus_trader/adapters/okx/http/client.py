@@ -125,7 +125,7 @@ class OKXHttpClient:
     def _get_timestamp(self) -> str:
         now = datetime.datetime.now(datetime.UTC)
         t = now.isoformat("T", "milliseconds")
-        return t.split("+")[0] + "Z"
+        return t.partition("+")[0] + "Z"
 
     def _sign(self, timestamp: str, method: str, url_path: str, body: str) -> str:
         if body == "{}" or body == "None":
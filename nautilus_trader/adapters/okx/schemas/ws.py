@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import json
 from decimal import Decimal
 from typing import Literal
 
@@ -740,7 +739,7 @@ class OKXWsOrdersData(msgspec.Struct):
             trailing_offset=None,
             trailing_offset_type=TrailingOffsetType.NO_TRAILING_OFFSET,
             post_only=self.ordType == OKXOrderType.POST_ONLY,
-            reduce_only=json.loads(self.reduceOnly),
+            reduce_only=self.reduceOnly == "true",
             cancel_reason=cancel_reason,
             expire_time=None,
             ts_triggered=None,
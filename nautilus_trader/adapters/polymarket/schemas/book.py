@@ -13,12 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import uuid
-
 import msgspec
 
 from nautilus_trader.adapters.polymarket.common.enums import PolymarketOrderSide
 from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
@@ -227,7 +226,7 @@ class PolymarketTrade(msgspec.Struct, tag="last_trade_price", tag_field="event_t
             price=instrument.make_price(float(self.price)),
             size=instrument.make_qty(float(self.size)),
             aggressor_side=aggressor_side,
-            trade_id=TradeId(str(uuid.uuid4())),
+            trade_id=TradeId(UUID4().value),
             ts_event=millis_to_nanos(float(self.timestamp)),
             ts_init=ts_init,
         )
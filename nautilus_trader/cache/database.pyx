@@ -233,11 +233,11 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             list result
             bytes value_bytes
         for key in general_keys:
-            key = key.split(':', maxsplit=1)[1]
+            key = key.partition(':')[2]
             result = self._backing.read(key)
             value_bytes = result[0]
             if value_bytes is not None:
-                key = key.split(':', maxsplit=1)[1]
+                key = key.partition(':')[2]
                 general[key] = value_bytes
 
         return general
@@ -56,6 +56,8 @@ class ExecutionReport(Document):
     The base class for all execution reports.
     """
 
+    __slots__ = ("account_id", "instrument_id")
+
     def __init__(
         self,
         account_id: AccountId,
@@ -149,6 +151,35 @@ class OrderStatusReport(ExecutionReport):
 
     """
 
+    __slots__ = (
+        "avg_px",
+        "cancel_reason",
+        "client_order_id",
+        "contingency_type",
+        "display_qty",
+        "expire_time",
+        "filled_qty",
+        "leaves_qty",
+        "limit_offset",
+        "order_list_id",
+        "order_side",
+        "order_status",
+        "order_type",
+        "post_only",
+        "price",
+        "quantity",
+        "reduce_only",
+        "time_in_force",
+        "trailing_offset",
+        "trailing_offset_type",
+        "trigger_price",
+        "trigger_type",
+        "ts_accepted",
+        "ts_last",
+        "ts_triggered",
+        "venue_order_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -339,6 +370,19 @@ class FillReport(ExecutionReport):
 
     """
 
+    __slots__ = (
+        "client_order_id",
+        "commission",
+        "last_px",
+        "last_qty",
+        "liquidity_side",
+        "order_side",
+        "trade_id",
+        "ts_event",
+        "venue_order_id",
+        "venue_position_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -434,6 +478,14 @@ class PositionStatusReport(ExecutionReport):
 
     """
 
+    __slots__ = (
+        "position_side",
+        "quantity",
+        "signed_decimal_qty",
+        "ts_last",
+        "venue_position_id",
+    )
+
     def __init__(
         self,
         account_id: AccountId,
@@ -986,6 +986,44 @@ async def test_fok_order_found_in_cache(exec_client, setup_order_state, strategy
     assert cache.order(client_order_id).status == OrderStatus.CANCELED
 
 
+@pytest.mark.asyncio
+async def test_executable_order_update_unknown_venue_order_id(exec_client, fill_events):
+    # Arrange
+    unmatched_order = BFOrder(
+        id=323421338058,
+        p=9.6,
+        s=2.8,
+        side="L",
+        status="E",
+        pt="L",
+        ot="L",
+        pd=1696391679000,
+        bsp=None,
+        rfo="O-20231004-0354-001",
+        rfs="OrderBookImbala",
+        rc="REG_LGA",
+        rac="",
+        md=1696391679000,
+        cd=None,
+        ld=None,
+        avp=9.6,
+        sm=1.0,
+        sr=1.8,
+        sl=0.0,
+        sc=0.0,
+        sv=0.0,
+        lsrc=None,
+    )
+
+    # Act
+    exec_client._handle_stream_executable_order_update(unmatched_order=unmatched_order)
+    await asyncio.sleep(0)
+
+    # Assert
+    assert VenueOrderId("323421338058") not in exec_client.venue_order_id_to_client_order_id
+    assert len(fill_events) == 0
+
+
 @pytest.mark.asyncio
 async def test_generate_order_status_reports_executable(exec_client):
     # Arrange
@@ -79,6 +79,24 @@ def test_retrieve_from_cache(client_order_id_helper) -> None:
     assert result == expected_result
 
 
+def test_retrieve_from_cache_with_new_helper(cache) -> None:
+    """
+    Test the get_client_order_id method falls back to the cache for a new helper.
+    """
+    # Prepare
+    expected_result = ClientOrderId(str(uuid4()))
+    client_order_id_int = ClientOrderIdHelper(cache=cache).generate_client_order_id_int(
+        expected_result,
+    )
+    client_order_id_helper = ClientOrderIdHelper(cache=cache)
+
+    # Act
+    result = client_order_id_helper.get_client_order_id(client_order_id_int)
+
+    # Assert
+    assert result == expected_result
+
+
 def test_retrieve_from_empty_cache(client_order_id_helper) -> None:
     """
     Test the generate_client_order_id_int method with an integer.
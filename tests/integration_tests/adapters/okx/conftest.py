@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Create fixtures for commonly used objects.
+"""
+
+import pytest
+
+from nautilus_trader.adapters.okx.common.constants import OKX_VENUE
+from nautilus_trader.adapters.okx.common.enums import OKXInstrumentType
+from nautilus_trader.adapters.okx.http.client import OKXHttpClient
+from nautilus_trader.adapters.okx.providers import OKXInstrumentProvider
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Venue
+
+
+@pytest.fixture
+def instrument_id() -> InstrumentId:
+    """
+    Create a stub instrument id.
+    """
+    return InstrumentId.from_str("BTC-USDT-SWAP-LINEAR.OKX")
+
+
+@pytest.fixture(scope="session")
+def live_clock() -> LiveClock:
+    """
+    Create a stub live clock.
+    """
+    return LiveClock()
+
+
+@pytest.fixture(scope="session")
+def http_client(live_clock: LiveClock) -> OKXHttpClient:
+    """
+    Create a stub HTTP client.
+    """
+    return OKXHttpClient(
+        clock=live_clock,
+        api_key="OKX_API_KEY",
+        api_secret="OKX_API_SECRET",
+        passphrase="OKX_PASSPHRASE",
+        base_url="https://www.okx.com",
+        is_demo=True,
+    )
+
+
+@pytest.fixture()
+def instrument_provider(http_client: OKXHttpClient, live_clock: LiveClock) -> OKXInstrumentProvider:
+    """
+    Create a stub instrument provider.
+    """
+    return OKXInstrumentProvider(
+        client=http_client,
+        clock=live_clock,
+        instrument_types=(OKXInstrumentType.SWAP,),
+    )
+
+
+@pytest.fixture()
+def venue() -> Venue:
+    """
+    Create a stub OKX venue.
+    """
+    return OKX_VENUE
+
+
+@pytest.fixture()
+def data_client():
+    pass
+
+
+@pytest.fixture()
+def exec_client():
+    pass
+
+
+@pytest.fixture()
+def instrument():
+    pass
+
+
+@pytest.fixture()
+def account_state():
+    pass
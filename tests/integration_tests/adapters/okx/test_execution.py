@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Unit tests for the OKX execution client.
+"""
+
+import pytest
+
+from nautilus_trader.adapters.okx.config import OKXExecClientConfig
+from nautilus_trader.adapters.okx.execution import OKXExecutionClient
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.execution.messages import SubmitOrderList
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+
+@pytest.fixture()
+def okx_exec_client(event_loop, http_client, msgbus, cache, live_clock, instrument_provider):
+    """
+    Create a stub OKX execution client.
+    """
+    return OKXExecutionClient(
+        loop=event_loop,
+        client=http_client,
+        msgbus=msgbus,
+        cache=cache,
+        clock=live_clock,
+        instrument_provider=instrument_provider,
+        config=OKXExecClientConfig(
+            api_key="OKX_API_KEY",
+            api_secret="OKX_API_SECRET",
+            passphrase="OKX_PASSPHRASE",
+            is_demo=True,
+        ),
+        name=None,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_submit_order_list_submits_each_order(
+    mocker,
+    okx_exec_client,
+    strategy,
+    cache,
+    trader_id,
+    instrument_id,
+) -> None:
+    """
+    Test the _submit_order_list method submits every order in the list once.
+    """
+    # Prepare
+    mock_submit_limit_order = mocker.AsyncMock()
+    okx_exec_client._submit_order_methods[OrderType.LIMIT] = mock_submit_limit_order
+
+    orders = [
+        strategy.order_factory.limit(
+            instrument_id=instrument_id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_str("0.01"),
+            price=Price.from_str(price),
+        )
+        for price in ("50000.0", "49000.0")
+    ]
+    for order in orders:
+        cache.add_order(order, None)
+
+    command = SubmitOrderList(
+        trader_id=trader_id,
+        strategy_id=strategy.id,
+        order_list=strategy.order_factory.create_list(orders),
+        command_id=UUID4(),
+        ts_init=0,
+    )
+
+    # Act
+    await okx_exec_client._submit_order_list(command)
+
+    # Assert
+    submitted = [call.args[0] for call in mock_submit_limit_order.call_args_list]
+    assert submitted == orders